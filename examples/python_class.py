@@ -0,0 +1,33 @@
+# Connecting to Pulumi
+import pulumi
+import pulumi_aws as aws
+
+# Intermediate Concepts
+class CloudResource:
+    __slots__ = ("__name",)
+
+    def __init__(self, name):
+        self.__name = name  # Private attribute (encapsulation)
+
+    def get_name(self):
+        return self.__name
+
+class S3Bucket(CloudResource):  # Inherits from CloudResource
+    __slots__ = ("bucket",)
+
+    def __init__(self, name, is_public=False):
+        super().__init__(name)  # Call parent class's __init__
+        self.bucket = aws.s3.Bucket(
+            name,
+            acl="public-read" if is_public else "private"
+        )
+
+    def get_bucket_arn(self):
+        return self.bucket.arn
+
+# Usage in Pulumi
+if __name__ == "__main__":
+    my_bucket = S3Bucket("my-app-bucket", is_public=True)
+    pulumi.export("bucket_arn", my_bucket.get_bucket_arn())
+    print(my_bucket.get_name())  # Output: my-app-bucket
+    # print(my_bucket.__name)  # Error: AttributeError (cannot access private attribute)
@@ -0,0 +1,428 @@
+import pulumi
+import atexit
+import functools
+import importlib.util
+import logging
+import logging.handlers
+import sys
+from typing import Optional, Dict, List
+
+def _lazy_import(name: str):
+    """Import a module that only executes on first attribute access, reusing it if already loaded."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# pulumi_aws executes on first use in main(); its service submodules (ec2, s3, ...)
+# then load on demand
+aws = _lazy_import("pulumi_aws")
+
+# Configure logging for auditing and debugging; records are buffered and the
+# log file is only opened on the first flush (on error or at exit)
+_file_handler = logging.FileHandler('pulumi_deployment.log', delay=True)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_buffer = logging.handlers.MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=_file_handler)
+logging.getLogger().addHandler(_log_buffer)
+logging.getLogger().setLevel(logging.INFO)
+atexit.register(_log_buffer.flush)
+logger = logging.getLogger(__name__)
+
+# AWS provider configuration; an explicit namespace does not need a running engine
+_AWS_CFG = pulumi.Config("aws")
+
+# Tags applied to every resource; extend here to change the tagging policy
+_BASE_TAGS = {"Environment": "dev"}
+
+def _tags(name: str) -> Dict[str, str]:
+    """Build the tag dict for a resource."""
+    return {**_BASE_TAGS, "Name": name}
+
+def _asg_tags(name: str) -> List[Dict]:
+    """Build the tag list for an Auto Scaling group, propagated to its instances."""
+    return [{"key": k, "value": v, "propagate_at_launch": True} for k, v in _tags(name).items()]
+
+# Public-read bucket policy, split around the bucket name
+_PUBLIC_READ_POLICY_PREFIX = (
+    '{"Version": "2012-10-17", "Statement": [{"Effect": "Allow", "Principal": "*", '
+    '"Action": "s3:GetObject", "Resource": "arn:aws:s3:::'
+)
+_PUBLIC_READ_POLICY_SUFFIX = '/*"}]}'
+
+def _logged(kind: str):
+    """Log a failure to create the named resource before re-raising it."""
+    def decorator(init):
+        @functools.wraps(init)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return init(self, *args, **kwargs)
+            except Exception as e:
+                name = getattr(self, "name", args[0] if args else kwargs.get("name"))
+                logger.error("Failed to create %s %s: %s", kind, name, e)
+                raise
+        return wrapper
+    return decorator
+
+def _child_opts(parent: pulumi.ComponentResource) -> pulumi.ResourceOptions:
+    """Options for a component's children; the alias keeps the URNs they had as top-level resources."""
+    return pulumi.ResourceOptions(parent=parent, aliases=[pulumi.Alias(parent=pulumi.ROOT_STACK_RESOURCE)])
+
+class VPC(pulumi.ComponentResource):
+    """Class to manage a custom AWS VPC."""
+    @_logged("VPC")
+    def __init__(self, name: str, cidr_block: str, opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:network:VPC", name, None, opts)
+        child_opts = _child_opts(self)
+        self.vpc = aws.ec2.Vpc(
+            name,
+            cidr_block=cidr_block,
+            enable_dns_hostnames=True,
+            enable_dns_support=True,
+            tags=_tags(name),
+            opts=child_opts
+        )
+        self.register_outputs({"vpc_id": self.vpc.id})
+        logger.info("Created VPC: %s", name)
+
+    def get_vpc_id(self) -> pulumi.Output[str]:
+        return self.vpc.id
+
+class Subnet(pulumi.ComponentResource):
+    """Class to manage subnets within a VPC."""
+    @_logged("subnet")
+    def __init__(self, name: str, vpc_id: pulumi.Output[str], cidr_block: str, availability_zone: str, opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:network:Subnet", name, None, opts)
+        child_opts = _child_opts(self)
+        self.subnet = aws.ec2.Subnet(
+            name,
+            vpc_id=vpc_id,
+            cidr_block=cidr_block,
+            availability_zone=availability_zone,
+            tags=_tags(name),
+            opts=child_opts
+        )
+        self.register_outputs({"subnet_id": self.subnet.id})
+        logger.info("Created subnet: %s", name)
+
+    def get_subnet_id(self) -> pulumi.Output[str]:
+        return self.subnet.id
+
+class SecurityGroup(pulumi.ComponentResource):
+    """Class to manage a security group."""
+    @_logged("security group")
+    def __init__(self, name: str, vpc_id: pulumi.Output[str], rules: List[Dict], opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:network:SecurityGroup", name, None, opts)
+        child_opts = _child_opts(self)
+        self.security_group = aws.ec2.SecurityGroup(
+            name,
+            vpc_id=vpc_id,
+            description=f"Security group for {name}",
+            ingress=rules,
+            egress=[{"protocol": "-1", "from_port": 0, "to_port": 0, "cidr_blocks": ["0.0.0.0/0"]}],
+            tags=_tags(name),
+            opts=child_opts
+        )
+        self.register_outputs({"security_group_id": self.security_group.id})
+        logger.info("Created security group: %s", name)
+
+    def get_security_group_id(self) -> pulumi.Output[str]:
+        return self.security_group.id
+
+class S3Bucket(pulumi.ComponentResource):
+    """Class to manage an AWS S3 bucket for static content."""
+    @_logged("S3 bucket")
+    def __init__(self, name: str, is_public: bool = False, opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:storage:S3Bucket", name, None, opts)
+        child_opts = _child_opts(self)
+        self.bucket = aws.s3.Bucket(
+            name,
+            acl="public-read" if is_public else "private",
+            website={"index_document": "index.html"} if is_public else None,
+            tags=_tags(name),
+            opts=child_opts
+        )
+        if is_public:
+            self.bucket_policy = aws.s3.BucketPolicy(
+                f"{name}-policy",
+                bucket=self.bucket.id,
+                policy=pulumi.Output.concat(_PUBLIC_READ_POLICY_PREFIX, self.bucket.id, _PUBLIC_READ_POLICY_SUFFIX),
+                opts=child_opts
+            )
+        self.register_outputs({"bucket_arn": self.bucket.arn})
+        logger.info("Created S3 bucket: %s", name)
+
+    def get_bucket_arn(self) -> pulumi.Output[str]:
+        return self.bucket.arn
+
+    def get_bucket_name(self) -> str:
+        return self.name
+
+class EC2Instance(pulumi.ComponentResource):
+    """Class to manage an AWS EC2 instance."""
+    @_logged("EC2 instance")
+    def __init__(self, name: str, instance_type: str, ami_id: str, subnet_id: pulumi.Output[str], security_group_ids: List[pulumi.Output[str]], opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:compute:EC2Instance", name, None, opts)
+        child_opts = _child_opts(self)
+        self.instance = aws.ec2.Instance(
+            name,
+            instance_type=instance_type,
+            ami=ami_id,
+            subnet_id=subnet_id,
+            vpc_security_group_ids=security_group_ids,
+            tags=_tags(name),
+            opts=child_opts
+        )
+        self.register_outputs({"instance_id": self.instance.id, "public_ip": self.instance.public_ip})
+        logger.info("Created EC2 instance: %s", name)
+
+    def get_instance_id(self) -> pulumi.Output[str]:
+        return self.instance.id
+
+    def get_public_ip(self) -> pulumi.Output[str]:
+        return self.instance.public_ip
+
+class AutoScalingGroup(pulumi.ComponentResource):
+    """Class to manage an Auto Scaling group."""
+    @_logged("Auto Scaling group")
+    def __init__(self, name: str, launch_template_id: pulumi.Output[str], subnet_ids: List[pulumi.Output[str]], min_size: int, max_size: int, desired_capacity: int, opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:compute:AutoScalingGroup", name, None, opts)
+        child_opts = _child_opts(self)
+        self.asg = aws.autoscaling.Group(
+            name,
+            launch_template={"id": launch_template_id},
+            min_size=min_size,
+            max_size=max_size,
+            desired_capacity=desired_capacity,
+            vpc_zone_identifier=subnet_ids,
+            tags=_asg_tags(name),
+            opts=child_opts
+        )
+        self.register_outputs({"asg_name": self.asg.name})
+        logger.info("Created Auto Scaling group: %s", name)
+
+    def get_asg_name(self) -> pulumi.Output[str]:
+        return self.asg.name
+
+class RDSInstance(pulumi.ComponentResource):
+    """Class to manage an AWS RDS PostgreSQL instance."""
+    @_logged("RDS instance")
+    def __init__(self, name: str, instance_class: str, db_name: str, username: pulumi.Input[str], password: pulumi.Input[str], subnet_ids: List[pulumi.Output[str]], security_group_ids: List[pulumi.Output[str]], opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:database:RDSInstance", name, None, opts)
+        child_opts = _child_opts(self)
+        subnet_group_name = f"{name}-subnet-group"
+        self.db_subnet_group = aws.rds.SubnetGroup(
+            subnet_group_name,
+            subnet_ids=subnet_ids,
+            tags=_tags(subnet_group_name),
+            opts=child_opts
+        )
+        self.rds = aws.rds.Instance(
+            name,
+            instance_class=instance_class,
+            allocated_storage=20,
+            engine="postgres",
+            engine_version="13.7",
+            db_name=db_name,
+            username=username,
+            password=password,
+            vpc_security_group_ids=security_group_ids,
+            db_subnet_group_name=self.db_subnet_group.name,
+            multi_az=True,
+            tags=_tags(name),
+            opts=child_opts
+        )
+        self.register_outputs({"endpoint": self.rds.endpoint})
+        logger.info("Created RDS instance: %s", name)
+
+    def get_endpoint(self) -> pulumi.Output[str]:
+        return self.rds.endpoint
+
+class LoadBalancer(pulumi.ComponentResource):
+    """Class to manage an Application Load Balancer."""
+    @_logged("ALB")
+    def __init__(self, name: str, vpc_id: pulumi.Output[str], subnet_ids: List[pulumi.Output[str]], security_group_ids: List[pulumi.Output[str]], opts: Optional[pulumi.ResourceOptions] = None):
+        self.name = name
+        super().__init__("enterprise:network:LoadBalancer", name, None, opts)
+        child_opts = _child_opts(self)
+        self.alb = aws.lb.LoadBalancer(
+            name,
+            internal=False,
+            load_balancer_type="application",
+            subnets=subnet_ids,
+            security_groups=security_group_ids,
+            tags=_tags(name),
+            opts=child_opts
+        )
+        target_group_name = f"{name}-tg"
+        self.target_group = aws.lb.TargetGroup(
+            target_group_name,
+            port=80,
+            protocol="HTTP",
+            vpc_id=vpc_id,
+            target_type="instance",
+            health_check={"path": "/", "protocol": "HTTP"},
+            tags=_tags(target_group_name),
+            opts=child_opts
+        )
+        self.listener = aws.lb.Listener(
+            f"{name}-listener",
+            load_balancer_arn=self.alb.arn,
+            port=80,
+            protocol="HTTP",
+            default_actions=[{"type": "forward", "target_group_arn": self.target_group.arn}],
+            opts=child_opts
+        )
+        self.register_outputs({"dns_name": self.alb.dns_name})
+        logger.info("Created ALB: %s", name)
+
+    def get_dns_name(self) -> pulumi.Output[str]:
+        return self.alb.dns_name
+
+def get_latest_ami(region: str, provider: Optional[pulumi.ProviderResource] = None) -> pulumi.Output[str]:
+    """Look up the latest Amazon Linux 2 AMI ID through the region's provider without blocking."""
+    ami = aws.ec2.get_ami_output(
+        most_recent=True,
+        filters=[
+            aws.ec2.GetAmiFilterArgs(name="name", values=["amzn2-ami-hvm-*-x86_64-gp2"]),
+            aws.ec2.GetAmiFilterArgs(name="owner-alias", values=["amazon"])
+        ],
+        opts=pulumi.InvokeOptions(provider=provider)
+    )
+
+    def log_ami_id(ami_id: str) -> str:
+        logger.info("Retrieved AMI ID: %s for region %s", ami_id, region)
+        return ami_id
+
+    # Lookup failures surface through the Output chain when the engine resolves it
+    return ami.id.apply(log_ami_id)
+
+def main():
+    """Main function to deploy an enterprise-scale AWS infrastructure."""
+    try:
+        # Load Pulumi configuration; the project namespace is resolved here, not
+        # at import, so importing this module does not need a running engine
+        config = pulumi.Config()
+        region = _AWS_CFG.get("region") or "us-east-1"
+        instance_type = config.get("instance_type") or "t2.micro"
+        bucket_name = config.get("bucket_name") or "my-app-bucket-2025"
+        db_name = config.get("db_name") or "myappdb"
+        # Defaults are wrapped as secrets so they stay masked like configured values
+        db_username = config.get_secret("db_username") or pulumi.Output.secret("admin")
+        db_password = config.get_secret("db_password") or pulumi.Output.secret("securepassword123")  # Set real secrets in production
+        min_size = config.get_int("min_size") or 2
+        max_size = config.get_int("max_size") or 4
+        desired_capacity = config.get_int("desired_capacity") or 2
+
+        # Configure AWS provider
+        aws_provider = aws.Provider(
+            "aws-provider",
+            region=region,
+            max_retries=10,
+            skip_credentials_validation=True,
+            skip_region_validation=True
+        )
+        # Shared by every resource; the SDK copies options rather than mutating them
+        aws_opts = pulumi.ResourceOptions(provider=aws_provider)
+
+        # Register independent resources first; the engine infers every other
+        # dependency from the Outputs passed in, so no depends_on is needed
+
+        # Retrieve latest AMI
+        ami_id = get_latest_ami(region, provider=aws_provider)
+
+        # Create S3 bucket for static content
+        s3_bucket = S3Bucket(bucket_name, is_public=True, opts=aws_opts)
+
+        # Create VPC
+        vpc = VPC("my-app-vpc", "10.0.0.0/16", opts=aws_opts)
+        vpc_id = vpc.get_vpc_id()
+
+        # Create security groups
+        web_sg = SecurityGroup(
+            "web-sg",
+            vpc_id,
+            [
+                {"protocol": "tcp", "from_port": 80, "to_port": 80, "cidr_blocks": ["0.0.0.0/0"]},
+                {"protocol": "tcp", "from_port": 22, "to_port": 22, "cidr_blocks": ["0.0.0.0/0"]}
+            ],
+            opts=aws_opts
+        )
+        web_sg_id = web_sg.get_security_group_id()
+        db_sg = SecurityGroup(
+            "db-sg",
+            vpc_id,
+            [{"protocol": "tcp", "from_port": 5432, "to_port": 5432, "cidr_blocks": ["10.0.0.0/16"]}],
+            opts=aws_opts
+        )
+        db_sg_id = db_sg.get_security_group_id()
+
+        # Create subnets
+        subnets = [
+            Subnet("subnet-1", vpc_id, "10.0.1.0/24", f"{region}a", opts=aws_opts),
+            Subnet("subnet-2", vpc_id, "10.0.2.0/24", f"{region}b", opts=aws_opts)
+        ]
+        subnet_ids = [subnet.get_subnet_id() for subnet in subnets]
+
+        # Create Application Load Balancer
+        alb = LoadBalancer("app-alb", vpc_id, subnet_ids, [web_sg_id], opts=aws_opts)
+
+        # Create RDS instance
+        rds = RDSInstance(
+            "app-db",
+            "db.t3.micro",
+            db_name,
+            db_username,
+            db_password,
+            subnet_ids,
+            [db_sg_id],
+            opts=aws_opts
+        )
+
+        # Create launch template for Auto Scaling
+        launch_template = aws.ec2.LaunchTemplate(
+            "app-launch-template",
+            image_id=ami_id,
+            instance_type=instance_type,
+            vpc_security_group_ids=[web_sg_id],
+            tags=_tags("app-launch-template"),
+            opts=aws_opts
+        )
+
+        # Create Auto Scaling group
+        asg = AutoScalingGroup(
+            "app-asg",
+            launch_template.id,
+            subnet_ids,
+            min_size,
+            max_size,
+            desired_capacity,
+            opts=aws_opts
+        )
+
+        # Export outputs
+        pulumi.export("network", pulumi.Output.all(vpc_id=vpc_id, subnet_ids=subnet_ids))
+        pulumi.export("storage", pulumi.Output.all(name=s3_bucket.get_bucket_name(), arn=s3_bucket.get_bucket_arn()))
+        pulumi.export("asg_name", asg.get_asg_name())
+        pulumi.export("db_endpoint", rds.get_endpoint())
+        pulumi.export("alb_dns_name", alb.get_dns_name())
+        logger.info("Enterprise deployment completed successfully")
+
+    except Exception as e:
+        logger.error("Deployment failed: %s", e)
+        raise
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file